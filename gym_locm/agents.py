@@ -22,8 +22,11 @@ from gym_locm.engine import (
     PlayerOrder,
     Card,
 )
+from gym_locm.engine.card import KEYWORD_BITS
 from gym_locm.util import is_it, has_enough_mana
 
+_GUARD = KEYWORD_BITS["G"]
+
 
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs, flush=True)
@@ -172,7 +175,7 @@ class RuleBasedBattleAgent(Agent):
 
             if card.can_attack and not card.has_attacked_this_turn:
                 for enemy in state.opposing_player.lanes[Lane.LEFT]:
-                    if enemy.has_ability("G"):
+                    if enemy.keyword_mask & _GUARD:
                         target = enemy.instance_id
 
                         return Action(ActionType.ATTACK, origin, target)
@@ -184,7 +187,7 @@ class RuleBasedBattleAgent(Agent):
 
             if card.can_attack and not card.has_attacked_this_turn:
                 for enemy in state.opposing_player.lanes[Lane.RIGHT]:
-                    if enemy.has_ability("G"):
+                    if enemy.keyword_mask & _GUARD:
                         target = enemy.instance_id
 
                         return Action(ActionType.ATTACK, origin, target)
@@ -205,7 +208,7 @@ class MaxAttackBattleAgent(Agent):
         lanes = zip(list(Lane), state.current_player.lanes, state.opposing_player.lanes)
 
         for lane, friends, foes in lanes:
-            guard_foes = filter(lambda c: c.has_ability("G"), foes)
+            guard_foes = filter(lambda c: c.keyword_mask & _GUARD, foes)
 
             friends = filter(Creature.able_to_attack, friends)
             friends = sorted(friends, key=attrgetter("attack"), reverse=True)
@@ -3,8 +3,28 @@ from typing import List
 
 from gym_locm.exceptions import WardShieldError
 
+# keywords in their canonical order, and their bits in a card's keyword mask
+KEYWORDS = "BCDGLW"
+KEYWORD_BITS = {keyword: 1 << i for i, keyword in enumerate(KEYWORDS)}
+
 
 class Card:
+    __slots__ = (
+        "id",
+        "instance_id",
+        "name",
+        "type",
+        "cost",
+        "attack",
+        "defense",
+        "keyword_mask",
+        "player_hp",
+        "enemy_hp",
+        "card_draw",
+        "area",
+        "text",
+    )
+
     def __init__(
         self,
         card_id,
@@ -28,18 +48,26 @@ class Card:
         self.cost = cost
         self.attack = attack
         self.defense = defense
-        self.keywords = set(list(keywords.replace("-", "")))
+        self.keyword_mask = 0
+
+        for keyword in keywords:
+            self.keyword_mask |= KEYWORD_BITS.get(keyword, 0)
+
         self.player_hp = player_hp
         self.enemy_hp = enemy_hp
         self.card_draw = card_draw
         self.area = area
         self.text = text
 
+    @property
+    def keywords(self) -> str:
+        return "".join(k for k in KEYWORDS if self.keyword_mask & KEYWORD_BITS[k])
+
     def has_ability(self, keyword: str) -> bool:
-        return keyword in self.keywords
+        return bool(self.keyword_mask & KEYWORD_BITS.get(keyword, 0))
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             other is not None
             and self.instance_id is not None
             and other.instance_id is not None
@@ -53,69 +81,61 @@ class Card:
             return f"({self.instance_id})"
 
     def make_copy(self, instance_id=None) -> "Card":
-        cloned_card = Card.empty_copy(self)
+        cloned_card = self.__class__.__new__(self.__class__)
 
         cloned_card.id = self.id
+        cloned_card.instance_id = instance_id
         cloned_card.name = self.name
         cloned_card.type = self.type
         cloned_card.cost = self.cost
         cloned_card.attack = self.attack
         cloned_card.defense = self.defense
-        cloned_card.keywords = set(self.keywords)
+        cloned_card.keyword_mask = self.keyword_mask
         cloned_card.player_hp = self.player_hp
         cloned_card.enemy_hp = self.enemy_hp
         cloned_card.card_draw = self.card_draw
         cloned_card.area = self.area
         cloned_card.text = self.text
 
-        if instance_id is not None:
-            cloned_card.instance_id = instance_id
-        else:
-            cloned_card.instance_id = None
-
         return cloned_card
 
-    @staticmethod
-    def empty_copy(card):
-        class Empty(Card):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = type(card)
-
-        return new_copy
-
     @staticmethod
     def mockup_card():
         return Card(0, "", 0, 0, 0, 0, "------", 0, 0, 0, 0, "", instance_id=None)
 
 
+_CHARGE = KEYWORD_BITS["C"]
+_WARD = KEYWORD_BITS["W"]
+
+
 class Creature(Card):
+    __slots__ = ("is_dead", "can_attack", "has_attacked_this_turn", "summon_counter")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.is_dead = False
         self.can_attack = False
         self.has_attacked_this_turn = False
+        self.summon_counter = 0
 
     def remove_ability(self, ability: str):
-        self.keywords.discard(ability)
+        self.keyword_mask &= ~KEYWORD_BITS[ability]
 
     def add_ability(self, ability: str):
-        self.keywords.add(ability)
+        self.keyword_mask |= KEYWORD_BITS[ability]
 
     def able_to_attack(self) -> bool:
         return not self.has_attacked_this_turn and (
-            self.can_attack or self.has_ability("C")
+            self.can_attack or self.keyword_mask & _CHARGE != 0
         )
 
     def damage(self, amount: int = 1, lethal: bool = False) -> int:
         if amount <= 0:
             return 0
 
-        if self.has_ability("W"):
-            self.remove_ability("W")
+        if self.keyword_mask & _WARD:
+            self.keyword_mask &= ~_WARD
 
             raise WardShieldError()
 
@@ -132,24 +152,25 @@ class Creature(Card):
         cloned_card.is_dead = self.is_dead
         cloned_card.can_attack = self.can_attack
         cloned_card.has_attacked_this_turn = self.has_attacked_this_turn
+        cloned_card.summon_counter = self.summon_counter
 
         return cloned_card
 
 
 class Item(Card):
-    pass
+    __slots__ = ()
 
 
 class GreenItem(Item):
-    pass
+    __slots__ = ()
 
 
 class RedItem(Item):
-    pass
+    __slots__ = ()
 
 
 class BlueItem(Item):
-    pass
+    __slots__ = ()
 
 
 def load_cards() -> List["Card"]:
@@ -161,7 +182,6 @@ def load_cards() -> List["Card"]:
     cards = []
 
     with open(os.path.dirname(__file__) + "/resources/cardlist.txt", "r") as card_list:
-        raw_cards = card_list.readlines()
         type_mapping = {
             "creature": (Creature, 0),
             "itemGreen": (GreenItem, 1),
@@ -169,7 +189,7 @@ def load_cards() -> List["Card"]:
             "itemBlue": (BlueItem, 3),
         }
 
-        for card in raw_cards:
+        for card in card_list:
             (
                 card_id,
                 name,
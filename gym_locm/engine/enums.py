@@ -14,7 +14,7 @@ class PlayerOrder(IntEnum):
     SECOND = 1
 
     def opposing(self):
-        return PlayerOrder((self + 1) % 2)
+        return _OPPOSING_PLAYERS[self]
 
 
 class Lane(IntEnum):
@@ -22,7 +22,12 @@ class Lane(IntEnum):
     RIGHT = 1
 
     def opposing(self):
-        return Lane((self + 1) % 2)
+        return _OPPOSING_LANES[self]
+
+
+# lookups for opposing(), avoiding the enum constructor on every call
+_OPPOSING_PLAYERS = (PlayerOrder.SECOND, PlayerOrder.FIRST)
+_OPPOSING_LANES = (Lane.RIGHT, Lane.LEFT)
 
 
 class ActionType(Enum):
@@ -1,4 +1,3 @@
-from operator import attrgetter
 from typing import Tuple
 
 import numpy as np
@@ -6,6 +5,7 @@ import numpy as np
 from gym_locm.engine.player import Player
 from gym_locm.engine.action import Action
 from gym_locm.engine.card import (
+    KEYWORDS,
     Card,
     Creature,
     GreenItem,
@@ -21,6 +21,12 @@ from gym_locm.engine.phases import (
 )
 from gym_locm.exceptions import GameIsEndedError
 
+# abilities strings as in the native input (e.g. "-C-G--"), by keyword mask
+_ABILITIES = [
+    "".join(k if mask >> i & 1 else "-" for i, k in enumerate(KEYWORDS))
+    for mask in range(2 ** len(KEYWORDS))
+]
+
 
 class State:
     def __init__(
@@ -65,6 +71,8 @@ class State:
                 f'Invalid version {version}. Supported versions: "1.5" and "1.2"'
             )
 
+        self.current_player, self.opposing_player = self.players
+
         self._phase = self.deck_building_phase
         self._phase.prepare()
 
@@ -72,13 +80,14 @@ class State:
     def _current_player(self) -> PlayerOrder:
         return self._phase._current_player
 
-    @property
-    def current_player(self) -> Player:
-        return self.players[self._current_player]
+    def _update_players(self):
+        # the current and opposing players are accessed very often,
+        # so they are kept as plain attributes instead of properties
+        current_player = self._phase._current_player
 
-    @property
-    def opposing_player(self) -> Player:
-        return self.players[(int(self._current_player) + 1) % 2]
+        if current_player is not None:
+            self.current_player = self.players[current_player]
+            self.opposing_player = self.players[1 - current_player]
 
     @property
     def available_actions(self) -> Tuple[Action]:
@@ -140,10 +149,13 @@ class State:
         elif self.phase == Phase.DECK_BUILDING:
             cloned_state._phase = cloned_state.deck_building_phase
 
+        cloned_state.current_player = cloned_state.players[self.current_player.id]
+        cloned_state.opposing_player = cloned_state.players[self.opposing_player.id]
+
         return cloned_state
 
     def __str__(self) -> str:
-        encoding = ""
+        parts = []
 
         p, o = self.current_player, self.opposing_player
 
@@ -154,11 +166,13 @@ class State:
             if self.version == "1.5":
                 deck_length = 0 if self.is_deck_building() else len(cp.deck)
 
-                encoding += (
+                parts.append(
                     f"{cp.health} {cp.base_mana + cp.bonus_mana} {deck_length} {draw}\n"
                 )
             elif self.version == "1.2":
-                encoding += f"{cp.health} {cp.base_mana + cp.bonus_mana} {len(cp.deck)} {cp.next_rune} {draw}\n"
+                parts.append(
+                    f"{cp.health} {cp.base_mana + cp.bonus_mana} {len(cp.deck)} {cp.next_rune} {draw}\n"
+                )
 
         op_hand = len(o.hand) if self.phase != Phase.DECK_BUILDING else 0
         last_actions = []
@@ -169,7 +183,7 @@ class State:
 
             last_actions.append(action)
 
-        encoding += f"{op_hand} {len(last_actions)}\n"
+        parts.append(f"{op_hand} {len(last_actions)}\n")
 
         for a in reversed(last_actions):
             target_id = -1 if a.target is None else a.target
@@ -177,66 +191,52 @@ class State:
             if isinstance(target_id, Card):
                 target_id = target_id.instance_id
 
-            encoding += (
+            parts.append(
                 f"{a.resolved_origin.id} {a.type.name} " f"{a.origin} {target_id}\n"
             )
 
-        cards = (
-            p.hand
-            + sorted(p.lanes[0] + p.lanes[1], key=attrgetter("summon_counter"))
-            + sorted(o.lanes[0] + o.lanes[1], key=attrgetter("summon_counter"))
-        )
-
-        encoding += f"{len(cards)}\n"
-
-        for c in cards:
-            if c in p.hand:
-                c.location = 0
-                c.lane = -1
-            elif c in p.lanes[0] + p.lanes[1]:
-                c.location = 1
-                c.lane = 0 if c in p.lanes[0] else 1
-            elif c in o.lanes[0] + o.lanes[1]:
-                c.location = -1
-                c.lane = 0 if c in o.lanes[0] else 1
+        # tag each card with its location and lane as the list is built,
+        # instead of searching the hand and lanes for every card afterwards
+        cards = [(c, 0, -1) for c in p.hand]
+
+        for player, location in (p, 1), (o, -1):
+            board = [(c, location, lane) for lane in (0, 1) for c in player.lanes[lane]]
+            board.sort(key=lambda entry: entry[0].summon_counter)
+
+            cards += board
 
+        parts.append(f"{len(cards)}\n")
+
+        for c, location, lane in cards:
             if isinstance(c.type, int):
-                c.cardType = c.type
+                card_type = c.type
             elif c.type == "creature":
-                c.cardType = 0
+                card_type = 0
             elif c.type == "itemGreen":
-                c.cardType = 1
+                card_type = 1
             elif c.type == "itemRed":
-                c.cardType = 2
+                card_type = 2
             elif c.type == "itemBlue":
-                c.cardType = 3
-
-            abilities = list("------")
+                card_type = 3
 
-            for i, a in enumerate(list("BCDGLW")):
-                if c.has_ability(a):
-                    abilities[i] = a
+            abilities = _ABILITIES[c.keyword_mask]
 
-            c.abilities = "".join(abilities)
+            instance_id = -1 if c.instance_id is None else c.instance_id
 
-            c.instance_id = -1 if c.instance_id is None else c.instance_id
-
-        if self.version == "1.5":
-            for i, c in enumerate(cards):
-                encoding += (
-                    f"{c.id} {c.instance_id} {c.location} {c.cardType} "
-                    f"{c.cost} {c.attack} {c.defense} {c.abilities} "
-                    f"{c.player_hp} {c.enemy_hp} {c.card_draw} {c.area} {c.lane} \n"
+            if self.version == "1.5":
+                parts.append(
+                    f"{c.id} {instance_id} {location} {card_type} "
+                    f"{c.cost} {c.attack} {c.defense} {abilities} "
+                    f"{c.player_hp} {c.enemy_hp} {c.card_draw} {c.area} {lane} \n"
                 )
-        elif self.version == "1.2":
-            for i, c in enumerate(cards):
-                encoding += (
-                    f"{c.id} {c.instance_id} {c.location} {c.cardType} "
-                    f"{c.cost} {c.attack} {c.defense} {c.abilities} "
-                    f"{c.player_hp} {c.enemy_hp} {c.card_draw} {c.lane} \n"
+            elif self.version == "1.2":
+                parts.append(
+                    f"{c.id} {instance_id} {location} {card_type} "
+                    f"{c.cost} {c.attack} {c.defense} {abilities} "
+                    f"{c.player_hp} {c.enemy_hp} {c.card_draw} {lane} \n"
                 )
 
-        return encoding
+        return "".join(parts)
 
     def is_deck_building(self):
         return self.phase == Phase.DECK_BUILDING
@@ -255,14 +255,7 @@ class State:
 
     @staticmethod
     def empty_copy():
-        class Empty(State):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = State
-
-        return new_copy
+        return State.__new__(State)
 
     @staticmethod
     def from_native_input(game_input, deck_orders=((), ())):
@@ -319,6 +312,7 @@ class State:
         if mana != 0:
             state.phase = Phase.BATTLE
             state._phase = state.battle_phase
+            state._update_players()
         else:
             state._phase.turn = deck + 1
 
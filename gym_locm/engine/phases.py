@@ -11,9 +11,11 @@ from gym_locm.engine.card import (
     get_locm12_card_list,
     Creature,
     Card,
+    Item,
     GreenItem,
     RedItem,
     BlueItem,
+    KEYWORD_BITS,
 )
 from gym_locm.engine.enums import (
     DamageSource,
@@ -32,7 +34,47 @@ from gym_locm.exceptions import (
     InvalidCardError,
     WardShieldError,
 )
-from gym_locm.util import is_it, has_enough_mana
+
+_BREAKTHROUGH = KEYWORD_BITS["B"]
+_DRAIN = KEYWORD_BITS["D"]
+_GUARD = KEYWORD_BITS["G"]
+_LETHAL = KEYWORD_BITS["L"]
+
+# locations searched for cards, in the order they are searched
+_CARD_LOCATIONS = (
+    Location.PLAYER_HAND,
+    Location.ENEMY_HAND,
+    Location.PLAYER_LEFT_LANE,
+    Location.PLAYER_RIGHT_LANE,
+    Location.ENEMY_LEFT_LANE,
+    Location.ENEMY_RIGHT_LANE,
+)
+_PLAYER_LANES = (Location.PLAYER_LEFT_LANE, Location.PLAYER_RIGHT_LANE)
+_ENEMY_LANES = (Location.ENEMY_LEFT_LANE, Location.ENEMY_RIGHT_LANE)
+
+# enum members used in the battle loop, bound once since looking them up on
+# their enum class costs several times more than the comparison itself
+_SUMMON = ActionType.SUMMON
+_ATTACK = ActionType.ATTACK
+_USE = ActionType.USE
+_PASS = ActionType.PASS
+_FIRST = PlayerOrder.FIRST
+_SECOND = PlayerOrder.SECOND
+
+
+# battle actions are immutable, so they are built once and shared between states
+_action_pool = dict()
+
+
+def _pooled_action(action_type: ActionType, origin=None, target=None) -> Action:
+    key = action_type, origin, target
+
+    action = _action_pool.get(key)
+
+    if action is None:
+        action = _action_pool[key] = Action(action_type, origin, target)
+
+    return action
 
 
 class Phase(ABC):
@@ -88,14 +130,8 @@ class Phase(ABC):
 
     @staticmethod
     def empty_copy(of_class):
-        class Empty(of_class):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = of_class
-
-        return new_copy
+        # bypass __init__ without defining a throwaway subclass on every call
+        return of_class.__new__(of_class)
 
 
 class DeckBuildingPhase(Phase, ABC):
@@ -127,6 +163,7 @@ class DraftPhase(DeckBuildingPhase):
 
         # initialize current player pointer
         self._current_player = PlayerOrder.FIRST
+        self.state._update_players()
 
         # initialize random draft cards
         self._draft_cards = self._new_draft()
@@ -141,19 +178,21 @@ class DraftPhase(DeckBuildingPhase):
 
         # if items are not wanted, filter them out of the card list
         if not self.items:
-            cards = list(filter(is_it(Creature), cards))
+            cards = [card for card in cards if isinstance(card, Creature)]
 
         # get 60 random cards from the card list
         self.rng.shuffle(cards)
         pool = cards[:60]
 
-        # get 3 random cards without replacement for each turn
+        # get 3 random cards without replacement for each turn; the pool is
+        # reshuffled in place every turn, as seeded drafts depend on it
         draft = []
+        shuffle, k = self.rng.shuffle, self.k
 
         for _ in range(self.n):
-            self.rng.shuffle(pool)
+            shuffle(pool)
 
-            draft.append(pool[: self.k])
+            draft.append(pool[:k])
 
         return draft
 
@@ -164,7 +203,7 @@ class DraftPhase(DeckBuildingPhase):
         card = self.current_choices[chosen_index]
 
         # add chosen card to player's deck
-        self.state.players[self._current_player].deck.append(card)
+        self.state.current_player.deck.append(card)
 
         # trigger next turn
         self._next_turn()
@@ -185,6 +224,8 @@ class DraftPhase(DeckBuildingPhase):
                 self._current_player = None
                 self.ended = True
 
+        self.state._update_players()
+
     @property
     def current_choices(self) -> List[Card]:
         try:
@@ -233,6 +274,7 @@ class ConstructedPhase(DeckBuildingPhase):
 
         # initialize current player pointer
         self._current_player = PlayerOrder.FIRST
+        self.state._update_players()
 
         # initialize random constructed cards
         seed = np.random.choice(self._deck_pool_seeds) if len(self._deck_pool_seeds) else None
@@ -249,13 +291,14 @@ class ConstructedPhase(DeckBuildingPhase):
         return card_pool
 
     def act(self, action: Action):
+        current_player = self._current_player
+        player_mask = self._action_mask[current_player]
+
         # get chosen card
         if action.type == ActionType.CHOOSE:
             chosen_card_id = action.origin
         elif action.type == ActionType.PASS:
-            chosen_card_id = self.action_mask().index(
-                True
-            )  # get first choose-able card
+            chosen_card_id = player_mask.index(True)  # get first choose-able card
         else:
             raise MalformedActionError(
                 f"Actions in constructed should be of types CHOOSE or PASS, not {action.type}"
@@ -267,9 +310,9 @@ class ConstructedPhase(DeckBuildingPhase):
         if 0 >= chosen_card_index >= self.k:
             raise MalformedActionError(f"Invalid card ID: {chosen_card_id}")
 
-        player_choices = self._choices[self._current_player]
+        player_choices = self._choices[current_player]
 
-        if not self.action_mask()[chosen_card_index]:
+        if not player_mask[chosen_card_index]:
             raise MalformedActionError(
                 f"Can't choose more copies of card {chosen_card_id}"
             )
@@ -279,11 +322,11 @@ class ConstructedPhase(DeckBuildingPhase):
 
         # update action mask, if needed
         if player_choices[chosen_card_index] >= self.max_copies:
-            self._action_mask[self._current_player][chosen_card_index] = False
+            player_mask[chosen_card_index] = False
 
         # add chosen card to player's deck
         card = self._constructed_cards[chosen_card_index]
-        self.state.players[self._current_player].deck.append(card)
+        self.state.current_player.deck.append(card)
 
         # trigger next turn
         self._next_turn()
@@ -304,6 +347,8 @@ class ConstructedPhase(DeckBuildingPhase):
                 self._current_player = None
                 self.ended = True
 
+        self.state._update_players()
+
         # populate players' hands
         if not self.ended:
             for player in self.state.players:
@@ -339,6 +384,8 @@ class BattlePhase(Phase):
 
         self._same_shuffle = same_shuffle
 
+        self._card_index = None
+
     def _next_instance_id(self):
         self.instance_counter += 1
 
@@ -346,158 +393,132 @@ class BattlePhase(Phase):
 
     def available_actions(self) -> Tuple[Action]:
         if self._available_actions is None:
-            current_player = self.state.players[self._current_player]
-            opposing_player = self.state.players[self._current_player.opposing()]
-
-            summon, attack, use = [], [], []
-
-            c_hand = current_player.hand
-            c_lanes = current_player.lanes
-            o_lanes = opposing_player.lanes
-
-            for card in filter(has_enough_mana(current_player.mana), c_hand):
-                origin = card.instance_id
-
-                if isinstance(card, Creature):
-                    for lane in Lane:
-                        if len(c_lanes[lane]) < 3:
-                            summon.append(Action(ActionType.SUMMON, origin, lane))
-
-                elif isinstance(card, GreenItem):
-                    for lane in Lane:
-                        for friendly_creature in c_lanes[lane]:
-                            target = friendly_creature.instance_id
-
-                            use.append(Action(ActionType.USE, origin, target))
-
-                elif isinstance(card, RedItem):
-                    for lane in Lane:
-                        for enemy_creature in o_lanes[lane]:
-                            target = enemy_creature.instance_id
-
-                            use.append(Action(ActionType.USE, origin, target))
-
-                elif isinstance(card, BlueItem):
-                    for lane in Lane:
-                        for enemy_creature in o_lanes[lane]:
-                            target = enemy_creature.instance_id
-
-                            use.append(Action(ActionType.USE, origin, target))
-
-                    use.append(Action(ActionType.USE, origin, None))
-
-            for lane in Lane:
-                guard_creatures = []
-
-                for enemy_creature in o_lanes[lane]:
-                    if enemy_creature.has_ability("G"):
-                        guard_creatures.append(enemy_creature)
-
-                if not guard_creatures:
-                    valid_targets = o_lanes[lane] + [None]
-                else:
-                    valid_targets = guard_creatures
-
-                for friendly_creature in filter(Creature.able_to_attack, c_lanes[lane]):
-                    origin = friendly_creature.instance_id
-
-                    for valid_target in valid_targets:
-                        if valid_target is not None:
-                            valid_target = valid_target.instance_id
-
-                        attack.append(Action(ActionType.ATTACK, origin, valid_target))
-
-            available_actions = [Action(ActionType.PASS)] + summon + use + attack
-
-            self._available_actions = tuple(available_actions)
+            self._compute_legal_actions()
 
         return self._available_actions
 
-    def action_mask(self) -> Tuple[bool]:
+    def action_mask(self) -> np.ndarray:
         if self._action_mask is None:
-            action_mask = [False] * 145
-
-            # pass is always allowed
-            action_mask[0] = True
-
-            # shortcuts
-            cp = self.state.players[self._current_player]
-            op = self.state.players[self._current_player.opposing()]
-            cp_has_enough_mana = has_enough_mana(cp.mana)
-            left_lane_not_full = len(cp.lanes[0]) < 3
-            right_lane_not_full = len(cp.lanes[1]) < 3
-
-            def validate_creature(index):
-                if left_lane_not_full:
-                    action_mask[1 + index * 2] = True
-
-                if right_lane_not_full:
-                    action_mask[1 + index * 2 + 1] = True
+            self._compute_legal_actions()
 
-            def validate_green_item(index):
-                for i in range(len(cp.lanes[0])):
-                    action_mask[17 + index * 13 + 1 + i] = True
-
-                for i in range(len(cp.lanes[1])):
-                    action_mask[17 + index * 13 + 4 + i] = True
+        return self._action_mask
 
-            def validate_red_item(index):
-                for i in range(len(op.lanes[0])):
-                    action_mask[17 + index * 13 + 7 + i] = True
+    def _compute_legal_actions(self):
+        """
+        List the current player's legal actions and build their action mask
+        in a single pass over the hand and the board.
+        """
+        current_player = self.state.current_player
+        opposing_player = self.state.opposing_player
+
+        summon, attack, use = [], [], []
+        action_mask = [False] * 145
+
+        # pass is always allowed
+        action_mask[0] = True
+
+        mana = current_player.mana
+        c_hand = current_player.hand
+        c_lanes = current_player.lanes
+        o_lanes = opposing_player.lanes
+
+        # index the affordable cards in hand by how they are played,
+        # keeping their order and position in hand
+        creatures, items = [], []
+
+        # cards that are neither creatures nor items (e.g. the mockups of
+        # unknown cards in states built from native input) are not playable
+        for i, card in enumerate(c_hand):
+            if card.cost > mana:
+                continue
+
+            if isinstance(card, Creature):
+                creatures.append((i, card))
+            elif isinstance(card, Item):
+                items.append((i, card))
+
+        # the possible targets do not depend on the card being played,
+        # so they are gathered once for the whole hand, along with their
+        # offsets in a card's block of the action mask
+        summon_lanes = [lane for lane in Lane if len(c_lanes[lane]) < 3]
+        friendly_targets = [
+            (creature.instance_id, 1 + lane * 3 + j)
+            for lane in Lane
+            for j, creature in enumerate(c_lanes[lane])
+        ]
+        enemy_targets = [
+            (creature.instance_id, 7 + lane * 3 + j)
+            for lane in Lane
+            for j, creature in enumerate(o_lanes[lane])
+        ]
+
+        for i, card in creatures:
+            origin = card.instance_id
+
+            for lane in summon_lanes:
+                summon.append(_pooled_action(_SUMMON, origin, lane))
+                action_mask[1 + i * 2 + lane] = True
+
+        for i, card in items:
+            origin = card.instance_id
+            card_type = card.type
+
+            if card_type == 1:
+                targets = friendly_targets
+            elif card_type == 2:
+                targets = enemy_targets
+            else:
+                targets = enemy_targets + [(None, 0)]
 
-                for i in range(len(op.lanes[1])):
-                    action_mask[17 + index * 13 + 10 + i] = True
+            for target, offset in targets:
+                use.append(_pooled_action(_USE, origin, target))
+                action_mask[17 + i * 13 + offset] = True
 
-            def validate_blue_item(index):
-                validate_red_item(index)
+        for lane in Lane:
+            lane_targets, guard_targets = [], []
 
-                action_mask[17 + index * 13] = True
+            for j, enemy_creature in enumerate(o_lanes[lane]):
+                enemy_target = enemy_creature.instance_id, 1 + j
+                lane_targets.append(enemy_target)
 
-            check_playability = {
-                Creature: validate_creature,
-                GreenItem: validate_green_item,
-                RedItem: validate_red_item,
-                BlueItem: validate_blue_item,
-            }
+                if enemy_creature.keyword_mask & _GUARD:
+                    guard_targets.append(enemy_target)
 
-            # for each card in hand, check valid actions
-            for i, card in enumerate(cp.hand):
-                if cp_has_enough_mana(card):
-                    check_playability[type(card)](i)
+            if guard_targets:
+                valid_targets = guard_targets
+            else:
+                valid_targets = lane_targets
+                valid_targets.append((None, 0))
 
-            # for each card in the board, check valid actions
-            for offset, lane_id in zip((0, 3), (0, 1)):
-                for i, creature in enumerate(cp.lanes[lane_id]):
-                    i += offset
+            for j, friendly_creature in enumerate(c_lanes[lane]):
+                if not friendly_creature.able_to_attack():
+                    continue
 
-                    if creature.able_to_attack():
-                        guards = []
+                origin = friendly_creature.instance_id
 
-                        for j, enemy_creature in enumerate(op.lanes[lane_id]):
-                            if enemy_creature.has_ability("G"):
-                                guards.append(j)
+                for valid_target, offset in valid_targets:
+                    attack.append(_pooled_action(_ATTACK, origin, valid_target))
+                    action_mask[121 + (lane * 3 + j) * 4 + offset] = True
 
-                        if guards:
-                            for j in guards:
-                                action_mask[121 + i * 4 + 1 + j] = True
-                        else:
-                            action_mask[121 + i * 4] = True
+        available_actions = [_pooled_action(_PASS)] + summon + use + attack
 
-                            for j in range(len(op.lanes[lane_id])):
-                                action_mask[121 + i * 4 + 1 + j] = True
+        if not self.items:
+            action_mask = action_mask[:17] + action_mask[-24:]
 
-            if not self.items:
-                action_mask = action_mask[:17] + action_mask[-24:]
+        # masks are shared with cloned states, so they are handed out as
+        # read-only arrays
+        action_mask = np.array(action_mask, dtype=bool)
+        action_mask.flags.writeable = False
 
-            self._action_mask = action_mask
-
-        return self._action_mask
+        self._available_actions = tuple(available_actions)
+        self._action_mask = action_mask
 
     def prepare(self):
         super().prepare()
 
         """Prepare all game components for a battle phase"""
-        self._current_player = PlayerOrder.FIRST
+        self._current_player = _FIRST
+        self.state._update_players()
 
         players = self.state.players
 
@@ -520,7 +541,7 @@ class BattlePhase(Phase):
             self._draw(4, player=player)
             player.base_mana = 0
 
-        second_player = players[PlayerOrder.SECOND]
+        second_player = players[_SECOND]
         self._draw(player=second_player)
         second_player.bonus_mana = 1
 
@@ -528,65 +549,66 @@ class BattlePhase(Phase):
 
     def act(self, action: Action):
         """Execute the actions intended by the player in this battle turn"""
-        origin, target = action.origin, action.target
+        state = self.state
+        action_type, origin, target = action.type, action.origin, action.target
 
-        if isinstance(action.origin, int):
+        if isinstance(origin, int):
             origin, _ = self._find_card(origin)
 
-        if action.type == ActionType.SUMMON:
-            if isinstance(action.target, int):
+        if action_type == _SUMMON:
+            if isinstance(target, int):
                 target = Lane(target)
 
             self._do_summon(origin, target)
-        elif action.type == ActionType.ATTACK:
-            if isinstance(action.target, int):
+        elif action_type == _ATTACK:
+            if isinstance(target, int):
                 target, _ = self._find_card(target)
 
             self._do_attack(origin, target)
-        elif action.type == ActionType.USE:
-            if isinstance(action.target, int):
+        elif action_type == _USE:
+            if isinstance(target, int):
                 target, _ = self._find_card(target)
 
             self._do_use(origin, target)
-        elif action.type == ActionType.PASS:
+        elif action_type == _PASS:
             pass
         else:
             raise MalformedActionError("Invalid action type")
 
-        action.resolved_origin = origin
-        action.resolved_target = target
+        # actions may be shared between states, so the resolved cards are
+        # recorded on a copy of the action instead of on the action itself
+        played_action = Action(action_type, action.origin, action.target, action.number)
+        played_action.resolved_origin = origin
+        played_action.resolved_target = target
 
-        self.state.current_player.actions.append(action)
+        state.current_player.actions.append(played_action)
 
-        players = self.state.players
+        # remove dead creatures, keeping the lanes' order; only attacks and
+        # items can kill creatures, so other actions skip the sweep
+        if action_type == _ATTACK or action_type == _USE:
+            for player in state.players:
+                for lane in player.lanes:
+                    lane[:] = [creature for creature in lane if not creature.is_dead]
 
-        for player in players:
-            for lane in player.lanes:
-                creatures_to_remove = []
-
-                for creature in lane:
-                    if creature.is_dead:
-                        creatures_to_remove.append(creature)
-
-                for creature in creatures_to_remove:
-                    lane.remove(creature)
-
-        if action.type == ActionType.PASS:
+        if action_type == _PASS:
             self._next_turn()
 
         self._check_win_conditions()
 
-        # invalidate cached action list and masks
+        # invalidate cached action list, masks and card index
         self._available_actions = None
         self._action_mask = None
+        self._card_index = None
 
     def _check_win_conditions(self):
-        if self.state.players[PlayerOrder.FIRST].health <= 0:
+        first_player, second_player = self.state.players
+
+        if first_player.health <= 0:
             self.ended = True
-            self.winner = PlayerOrder.SECOND
-        elif self.state.players[PlayerOrder.SECOND].health <= 0:
+            self.winner = _SECOND
+        elif second_player.health <= 0:
             self.ended = True
-            self.winner = PlayerOrder.FIRST
+            self.winner = _FIRST
 
     def _damage_player(self, player: Player, amount: int, source: DamageSource) -> int:
         player.health -= amount
@@ -604,14 +626,19 @@ class BattlePhase(Phase):
         if player is None:
             player = self.state.current_player
 
-        for i in range(amount):
-            if len(player.hand) >= 8:
-                raise FullHandError()
+        hand, deck = player.hand, player.deck
+        drawn = max(0, min(amount, 8 - len(hand), len(deck)))
 
-            if len(player.deck) == 0:
-                raise EmptyDeckError(amount - i)
+        # move the cards at once, in the order they are popped from the deck
+        if drawn > 0:
+            hand.extend(reversed(deck[-drawn:]))
+            del deck[-drawn:]
 
-            player.hand.append(player.deck.pop())
+        if drawn < amount:
+            if len(hand) >= 8:
+                raise FullHandError()
+
+            raise EmptyDeckError(amount - drawn)
 
     def _handle_draw_from_empty_deck(self, remaining_draws: int = 1):
         self._damage_player(
@@ -626,29 +653,47 @@ class BattlePhase(Phase):
         )
 
     def _find_card(self, instance_id: int) -> Tuple[Card, Location]:
-        # todo: use an instance_id -> card mapping like in the original engine
-        c = self.state.players[self._current_player]
-        o = self.state.players[self._current_player.opposing()]
-
-        location_mapping = {
-            Location.PLAYER_HAND: c.hand,
-            Location.ENEMY_HAND: o.hand,
-            Location.PLAYER_LEFT_LANE: c.lanes[0],
-            Location.PLAYER_RIGHT_LANE: c.lanes[1],
-            Location.ENEMY_LEFT_LANE: o.lanes[0],
-            Location.ENEMY_RIGHT_LANE: o.lanes[1],
-        }
-
-        for location, cards in location_mapping.items():
-            for card in cards:
-                if card.instance_id == instance_id:
-                    return card, location
-
-        raise InvalidCardError(instance_id)
+        if self._card_index is None:
+            c = self.state.current_player
+            o = self.state.opposing_player
+
+            card_lists = (
+                c.hand,
+                o.hand,
+                c.lanes[0],
+                c.lanes[1],
+                o.lanes[0],
+                o.lanes[1],
+            )
+
+            # map instance ids to cards and their locations, keeping the
+            # first occurrence like the linear scan it replaces
+            card_index = {}
+
+            for location, cards in zip(_CARD_LOCATIONS, card_lists):
+                for card in cards:
+                    card_index.setdefault(card.instance_id, (card, location))
+
+            self._card_index = card_index
+
+        try:
+            return self._card_index[instance_id]
+        except KeyError:
+            raise InvalidCardError(instance_id)
+
+    def _locate(self, card: Card) -> Location:
+        """Return where a card is in the hands or lanes, or None if it is nowhere."""
+        if card is None:
+            return None
+
+        try:
+            return self._find_card(card.instance_id)[1]
+        except InvalidCardError:
+            return None
 
     def _do_summon(self, origin, target):
-        current_player = self.state.players[self._current_player]
-        opposing_player = self.state.players[self._current_player.opposing()]
+        current_player = self.state.current_player
+        opposing_player = self.state.opposing_player
 
         if origin.cost > current_player.mana:
             raise NotEnoughManaError()
@@ -667,6 +712,10 @@ class BattlePhase(Phase):
         except ValueError:
             raise MalformedActionError("Card is not in player's hand")
 
+        # cards in hand are shared between cloned states,
+        # so the creature put on the board is a new instance of the card
+        origin = origin.make_copy(origin.instance_id)
+
         origin.can_attack = False
         origin.summon_counter = self.summon_counter
 
@@ -713,31 +762,38 @@ class BattlePhase(Phase):
         current_player.mana -= origin.cost
 
     def _do_attack(self, origin, target):
-        current_player = self.state.players[self._current_player]
-        opposing_player = self.state.players[self._current_player.opposing()]
+        current_player = self.state.current_player
+        opposing_player = self.state.opposing_player
 
         if not isinstance(origin, Creature):
             raise MalformedActionError("Attacking card is not a creature")
 
-        if origin in current_player.lanes[Lane.LEFT]:
+        origin_location = self._locate(origin)
+
+        if origin_location == Location.PLAYER_LEFT_LANE:
             origin_lane = Lane.LEFT
-        elif origin in current_player.lanes[Lane.RIGHT]:
+        elif origin_location == Location.PLAYER_RIGHT_LANE:
             origin_lane = Lane.RIGHT
         else:
             raise MalformedActionError("Attacking creature is not owned by player")
 
-        guard_creatures = []
-
-        for creature in opposing_player.lanes[origin_lane]:
-            if creature.has_ability("G"):
-                guard_creatures.append(creature)
+        has_guard = any(
+            creature.keyword_mask & _GUARD
+            for creature in opposing_player.lanes[origin_lane]
+        )
 
-        if len(guard_creatures) > 0:
-            valid_targets = guard_creatures
+        # check the target through the card index rather than comparing it
+        # against every creature in the lane
+        if target is None:
+            is_valid_target = not has_guard
+        elif self._locate(target) != _ENEMY_LANES[origin_lane]:
+            is_valid_target = False
         else:
-            valid_targets = [None] + opposing_player.lanes[origin_lane]
+            target_card, _ = self._find_card(target.instance_id)
+
+            is_valid_target = not has_guard or target_card.keyword_mask & _GUARD
 
-        if target not in valid_targets:
+        if not is_valid_target:
             raise MalformedActionError("Invalid target")
 
         if not origin.able_to_attack():
@@ -753,35 +809,32 @@ class BattlePhase(Phase):
 
             try:
                 damage_dealt = target.damage(
-                    origin.attack, lethal=origin.has_ability("L")
+                    origin.attack, lethal=origin.keyword_mask & _LETHAL != 0
                 )
             except WardShieldError:
                 damage_dealt = 0
 
             try:
-                origin.damage(target.attack, lethal=target.has_ability("L"))
+                origin.damage(target.attack, lethal=target.keyword_mask & _LETHAL != 0)
             except WardShieldError:
                 pass
 
             excess_damage = damage_dealt - target_defense
 
-            if "B" in origin.keywords and excess_damage > 0:
+            if origin.keyword_mask & _BREAKTHROUGH and excess_damage > 0:
                 self._damage_player(
                     opposing_player, amount=excess_damage, source=DamageSource.OPPONENT
                 )
         else:
             raise MalformedActionError("Target is not a creature or a player")
 
-        if "D" in origin.keywords:
+        if origin.keyword_mask & _DRAIN:
             current_player.health += damage_dealt
 
         origin.has_attacked_this_turn = True
 
     def _do_use_green(self, origin, target):
-        is_own_creature = (
-            target in self.state.current_player.lanes[Lane.LEFT]
-            or target in self.state.current_player.lanes[Lane.RIGHT]
-        )
+        is_own_creature = self._locate(target) in _PLAYER_LANES
 
         if target is None or not is_own_creature:
             error = "Green items should be used on friendly creatures"
@@ -789,23 +842,20 @@ class BattlePhase(Phase):
 
         target.attack = max(0, target.attack + origin.attack)
         target.defense += origin.defense
-        target.keywords = target.keywords.union(origin.keywords)
+        target.keyword_mask |= origin.keyword_mask
 
         if target.defense <= 0:
             target.is_dead = True
 
     def _do_use_red(self, origin, target):
-        is_opp_creature = (
-            target in self.state.opposing_player.lanes[Lane.LEFT]
-            or target in self.state.opposing_player.lanes[Lane.RIGHT]
-        )
+        is_opp_creature = self._locate(target) in _ENEMY_LANES
 
         if target is None or not is_opp_creature:
             error = "Red items should be used on enemy creatures"
             raise MalformedActionError(error)
 
         target.attack = max(0, target.attack + origin.attack)
-        target.keywords = target.keywords.difference(origin.keywords)
+        target.keyword_mask &= ~origin.keyword_mask
 
         try:
             target.damage(-origin.defense)
@@ -816,10 +866,7 @@ class BattlePhase(Phase):
             target.is_dead = True
 
     def _do_use_blue(self, origin, target):
-        is_opp_creature = (
-            target in self.state.opposing_player.lanes[Lane.LEFT]
-            or target in self.state.opposing_player.lanes[Lane.RIGHT]
-        )
+        is_opp_creature = self._locate(target) in _ENEMY_LANES
 
         if target is not None and not is_opp_creature:
             error = "Blue items should be used on enemy creatures or enemy player"
@@ -827,7 +874,7 @@ class BattlePhase(Phase):
 
         if isinstance(target, Creature):
             target.attack = max(0, target.attack + origin.attack)
-            target.keywords = target.keywords.difference(origin.keywords)
+            target.keyword_mask &= ~origin.keyword_mask
 
             try:
                 target.damage(-origin.defense)
@@ -847,8 +894,8 @@ class BattlePhase(Phase):
             raise MalformedActionError("Invalid target")
 
     def _do_use(self, origin, target):
-        current_player = self.state.players[self._current_player]
-        opposing_player = self.state.players[self._current_player.opposing()]
+        current_player = self.state.current_player
+        opposing_player = self.state.opposing_player
 
         if origin.cost > current_player.mana:
             raise NotEnoughManaError()
@@ -857,7 +904,7 @@ class BattlePhase(Phase):
             error = "Target is not a creature or a player"
             raise MalformedActionError(error)
 
-        if origin not in current_player.hand:
+        if self._locate(origin) != Location.PLAYER_HAND:
             raise MalformedActionError("Card is not in player's hand")
 
         if origin.area != Area.NONE and target is not None:
@@ -901,36 +948,38 @@ class BattlePhase(Phase):
 
     def _next_turn(self):
         # handle turn change
-        if self._current_player == PlayerOrder.FIRST:
-            self._current_player = PlayerOrder.SECOND
+        if self._current_player == _FIRST:
+            self._current_player = _SECOND
         else:
-            self._current_player = PlayerOrder.FIRST
+            self._current_player = _FIRST
 
             self.turn += 1
 
+        self.state._update_players()
+
         self._new_battle_turn()
 
     def _new_battle_turn(self):
         # reset damage counters
         self.damage_counter = [0, 0]
 
-        current_player = self.state.players[self._current_player]
+        current_player = self.state.current_player
 
-        for creature in current_player.lanes[Lane.LEFT]:
-            creature.can_attack = True
-            creature.has_attacked_this_turn = False
+        for lane in current_player.lanes:
+            for creature in lane:
+                creature.can_attack = True
+                creature.has_attacked_this_turn = False
 
-        for creature in current_player.lanes[Lane.RIGHT]:
-            creature.can_attack = True
-            creature.has_attacked_this_turn = False
+        base_mana = current_player.base_mana
 
-        if current_player.base_mana > 0 and current_player.mana == 0:
+        if base_mana > 0 and current_player.mana == 0:
             current_player.bonus_mana = 0
 
-        if current_player.base_mana < 12:
-            current_player.base_mana += 1
+        if base_mana < 12:
+            base_mana += 1
+            current_player.base_mana = base_mana
 
-        current_player.mana = current_player.base_mana + current_player.bonus_mana
+        current_player.mana = base_mana + current_player.bonus_mana
 
         amount_to_draw = 1 + current_player.bonus_draw
 
@@ -954,6 +1003,7 @@ class BattlePhase(Phase):
         cloned_phase.instance_counter = self.instance_counter
         cloned_phase.summon_counter = self.summon_counter
         cloned_phase.damage_counter = list(self.damage_counter)
+        cloned_phase._card_index = None
 
         return cloned_phase
 
@@ -978,14 +1028,19 @@ class Version12BattlePhase(BattlePhase):
         if player is None:
             player = self.state.current_player
 
-        for i in range(amount):
-            if len(player.deck) == 0:
-                raise EmptyDeckError(amount - i)
+        hand, deck = player.hand, player.deck
+        drawn = max(0, min(amount, 8 - len(hand), len(deck)))
 
-            if len(player.hand) >= 8:
-                raise FullHandError()
+        if drawn > 0:
+            hand.extend(reversed(deck[-drawn:]))
+            del deck[-drawn:]
+
+        # an empty deck takes precedence over a full hand in this version
+        if drawn < amount:
+            if not deck:
+                raise EmptyDeckError(amount - drawn)
 
-            player.hand.append(player.deck.pop())
+            raise FullHandError()
 
     def _do_use(self, origin, target):
         super()._do_use(origin, target)
@@ -2,6 +2,21 @@ from gym_locm.exceptions import EmptyDeckError, FullHandError
 
 
 class Player:
+    __slots__ = (
+        "id",
+        "health",
+        "base_mana",
+        "bonus_mana",
+        "mana",
+        "next_rune",
+        "bonus_draw",
+        "last_drawn",
+        "deck",
+        "hand",
+        "lanes",
+        "actions",
+    )
+
     def __init__(self, player_id):
         self.id = player_id
 
@@ -30,9 +45,12 @@ class Player:
         cloned_player.mana = self.mana
         cloned_player.next_rune = self.next_rune
         cloned_player.bonus_draw = self.bonus_draw
+        cloned_player.last_drawn = self.last_drawn
 
-        cloned_player.deck = [card.make_copy(card.instance_id) for card in self.deck]
-        cloned_player.hand = [card.make_copy(card.instance_id) for card in self.hand]
+        # cards in the deck and in hand are never modified (summoned creatures
+        # are copied when they reach the board), so they can be shared
+        cloned_player.deck = list(self.deck)
+        cloned_player.hand = list(self.hand)
         cloned_player.lanes = tuple(
             [[card.make_copy(card.instance_id) for card in lane] for lane in self.lanes]
         )
@@ -43,11 +61,4 @@ class Player:
 
     @staticmethod
     def empty_copy():
-        class Empty(Player):
-            def __init__(self):
-                pass
-
-        new_copy = Empty()
-        new_copy.__class__ = Player
-
-        return new_copy
+        return Player.__new__(Player)
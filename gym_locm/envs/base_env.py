@@ -20,10 +20,67 @@ from gym_locm.engine import (
 from gym_locm.envs.rewards import parse_reward
 from gym_locm.exceptions import MalformedActionError
 
+# one-hot features of each card type, and the features of each keyword mask
+_CARD_TYPE_FEATURES = {
+    card_type: [1.0 if i == type_id else 0.0 for i in range(4)]
+    for type_id, card_type in enumerate((Creature, GreenItem, RedItem, BlueItem))
+}
+_NO_CARD_TYPE_FEATURES = [0.0] * 4
+_KEYWORD_FEATURES = [[(mask >> i) & 1 for i in range(6)] for mask in range(64)]
+
+# phases checked on every step, bound once to skip the enum class lookup
+_DECK_BUILDING = Phase.DECK_BUILDING
+_BATTLE = Phase.BATTLE
+
+
+def _battle_action_slots():
+    """
+    List what each battle action number refers to, as (action type, origin,
+    target) tuples. Cards are referred to by (side, lane, index) slots, where
+    side 0 is the current player, side 1 is the opponent and lane None is the
+    hand; summon targets are lanes and None targets the opponent.
+    """
+    slots = [(ActionType.PASS, None, None)]
+
+    # summon: 1 + hand index * 2 + lane
+    for index in range(8):
+        for lane in Lane:
+            slots.append((ActionType.SUMMON, (0, None, index), lane))
+
+    # use: 17 + hand index * 13 + target, where 0 is no target and the others
+    # are the creatures on each side, lane and position
+    for index in range(8):
+        origin = 0, None, index
+        slots.append((ActionType.USE, origin, None))
+
+        for side in range(2):
+            for lane in range(2):
+                for position in range(3):
+                    slots.append((ActionType.USE, origin, (side, lane, position)))
+
+    # attack: 121 + board position * 4 + target, where 0 is the opponent
+    for lane in range(2):
+        for position in range(3):
+            origin = 0, lane, position
+            slots.append((ActionType.ATTACK, origin, None))
+
+            for target in range(3):
+                slots.append((ActionType.ATTACK, origin, (1, lane, target)))
+
+    return tuple(slots)
 
-class LOCMEnv(gym.Env, ABC):
-    card_types = {Creature: 0, GreenItem: 1, RedItem: 2, BlueItem: 3}
 
+_BATTLE_ACTION_SLOTS = _battle_action_slots()
+
+
+def _card_in_slot(sides, slot):
+    side, lane, index = slot
+    player = sides[side]
+
+    return (player.hand if lane is None else player.lanes[lane])[index]
+
+
+class LOCMEnv(gym.Env, ABC):
     def __init__(
         self,
         seed=None,
@@ -331,10 +388,12 @@ class LOCMEnv(gym.Env, ABC):
         corresponding action object, if possible. Raises
         MalformedActionError otherwise.
         """
+        phase = self.state.phase
+
         try:
-            if self.state.phase == Phase.DECK_BUILDING:
+            if phase == _DECK_BUILDING:
                 return self.decode_deck_building_action(action_number)
-            elif self.state.phase == Phase.BATTLE:
+            elif phase == _BATTLE:
                 return self.decode_battle_action(action_number)
             else:
                 return None
@@ -362,78 +421,37 @@ class LOCMEnv(gym.Env, ABC):
         the corresponding action object, if possible. Raises
         MalformedActionError otherwise.
         """
-        player = self.state.current_player
-        opponent = self.state.opposing_player
-
         if not self.items and action_number > 16:
             action_number += 104
 
-        try:
-            if action_number == 0:
-                return Action(ActionType.PASS)
-            elif 1 <= action_number <= 16:
-                action_number -= 1
-
-                origin = int(action_number / 2)
-                target = Lane(action_number % 2)
-
-                origin = player.hand[origin].instance_id
-
-                return Action(ActionType.SUMMON, origin, target)
-            elif 17 <= action_number <= 120:
-                action_number -= 17
-
-                origin = int(action_number / 13)
-                target = action_number % 13
-
-                origin = player.hand[origin].instance_id
-
-                if target == 0:
-                    target = None
-                else:
-                    target -= 1
-
-                    side = [player, opponent][int(target / 6)]
-                    lane = int((target % 6) / 3)
-                    index = target % 3
-
-                    target = side.lanes[lane][index].instance_id
-
-                return Action(ActionType.USE, origin, target)
-            elif 121 <= action_number <= 144:
-                action_number -= 121
-
-                origin = action_number // 4
-                target = action_number % 4
+        if not 0 <= action_number < len(_BATTLE_ACTION_SLOTS):
+            raise MalformedActionError("Invalid action number")
 
-                lane = origin // 3
+        action_type, origin, target = _BATTLE_ACTION_SLOTS[action_number]
 
-                origin = player.lanes[lane][origin % 3].instance_id
+        if action_type == ActionType.PASS:
+            return Action(action_type)
 
-                if target == 0:
-                    target = None
-                else:
-                    target -= 1
+        sides = self.state.current_player, self.state.opposing_player
 
-                    target = opponent.lanes[lane][target].instance_id
+        try:
+            origin = _card_in_slot(sides, origin).instance_id
 
-                return Action(ActionType.ATTACK, origin, target)
-            else:
-                raise MalformedActionError("Invalid action number")
+            if target is not None and action_type != ActionType.SUMMON:
+                target = _card_in_slot(sides, target).instance_id
         except IndexError:
             raise MalformedActionError("Invalid action number")
 
+        return Action(action_type, origin, target)
+
     @staticmethod
     def encode_card(card, version="1.2"):
         """Encodes a card object into a numerical array."""
-        card_type = [
-            1.0 if isinstance(card, card_type) else 0.0
-            for card_type in LOCMEnv.card_types
-        ]
+        card_type = _CARD_TYPE_FEATURES.get(type(card), _NO_CARD_TYPE_FEATURES)
         cost = card.cost / 12
         attack = card.attack / 12
         defense = max(-12, card.defense) / 12
-        keywords = list(map(int, map(card.keywords.__contains__, "BCDGLW")))
+        keywords = _KEYWORD_FEATURES[card.keyword_mask]
         player_hp = card.player_hp / 12
         enemy_hp = card.enemy_hp / 12
         card_draw = card.card_draw / 2
@@ -455,7 +473,7 @@ class LOCMEnv(gym.Env, ABC):
         attack = card.attack / 12
         defense = card.defense / 12
         can_attack = int(card.can_attack and not card.has_attacked_this_turn)
-        keywords = list(map(int, map(card.keywords.__contains__, "BCDGLW")))
+        keywords = _KEYWORD_FEATURES[card.keyword_mask]
 
         return [attack, defense, can_attack] + keywords
 
@@ -464,7 +482,7 @@ class LOCMEnv(gym.Env, ABC):
         """Encodes a card object into a numerical array."""
         attack = card.attack / 12
         defense = card.defense / 12
-        keywords = list(map(int, map(card.keywords.__contains__, "BCDGLW")))
+        keywords = _KEYWORD_FEATURES[card.keyword_mask]
 
         return [attack, defense] + keywords
 
@@ -493,7 +511,7 @@ class LOCMEnv(gym.Env, ABC):
 
     def encode_state(self):
         """Encodes a state object into a numerical matrix."""
-        if self.state.phase == Phase.DECK_BUILDING:
+        if self.state.phase == _DECK_BUILDING:
             return self._encode_state_deck_building()
         else:
             return self._encode_state_battle()
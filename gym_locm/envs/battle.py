@@ -101,6 +101,15 @@ class LOCMBattleEnv(LOCMEnv):
 
     def step(self, action):
         """Makes an action in the game."""
+        reward, done, info = self._play(action)
+
+        return self.encode_state(), reward, done, info
+
+    def _play(self, action):
+        """
+        Makes an action in the game without encoding the resulting state,
+        for when only the state at the end of a sequence of actions is needed.
+        """
         # if the battle is finished, there should be no more actions
         if self._battle_is_finished:
             raise GameIsEndedError()
@@ -164,7 +173,7 @@ class LOCMBattleEnv(LOCMEnv):
 
         self.rewards[-1] += reward
 
-        return self.encode_state(), reward, done, info
+        return reward, done, info
 
     def reset(self) -> np.array:
         """
@@ -189,67 +198,50 @@ class LOCMBattleEnv(LOCMEnv):
         pass
 
     def _encode_state_battle(self):
-        encoded_state = np.full(self.state_shape, 0, dtype=np.float32)
+        encoded_state = np.zeros(self.state_shape, dtype=np.float32)
 
         p0, p1 = self.state.current_player, self.state.opposing_player
 
-        def fill_cards(card_list, up_to, features):
-            remaining_cards = up_to - len(card_list)
-
-            return card_list + [[0] * features for _ in range(remaining_cards)]
-
-        all_cards = []
-
-        # convert all cards in hand to features
-        hand = list(map(lambda c: self.encode_card(c, version=self.version), p0.hand))
+        # players info
+        player_features = 6 if self.version == "1.5" else 8
 
-        # if not using items, clip card type features
-        if not self.items:
-            hand = list(map(lambda c: c[4:], hand))
+        encoded_state[:player_features] = self.encode_players(
+            p0, p1, version=self.version
+        )
 
-        # add dummy cards up to the card limit
         card_features = 17 if self.items else 13
 
         if self.version == "1.2":
             card_features -= 1
 
-        hand = fill_cards(hand, up_to=8, features=card_features)
+        # write the cards' features straight into their rows of the state;
+        # rows of missing cards are left as zeros
+        start = player_features
+        hand = encoded_state[start : start + 8 * card_features].reshape(8, -1)
 
-        # add to card list
-        all_cards.extend([feature for card in hand for feature in card])
+        for i, card in enumerate(p0.hand):
+            encoded_card = self.encode_card(card, version=self.version)
 
-        # in current player's lanes
-        for location in (p0.lanes[0], p0.lanes[1]):
-            # convert all cards to features
-            location = list(map(self.encode_friendly_card_on_board, location))
+            # if not using items, clip card type features
+            hand[i] = encoded_card if self.items else encoded_card[4:]
 
-            # add dummy cards up to the card limit
-            location = fill_cards(location, up_to=3, features=9)
+        # in current player's lanes
+        start += 8 * card_features
+        friendly_board = encoded_state[start : start + 6 * 9].reshape(6, 9)
 
-            # add to card list
-            all_cards.extend([feature for card in location for feature in card])
+        for lane in range(2):
+            for i, card in enumerate(p0.lanes[lane]):
+                friendly_board[lane * 3 + i] = self.encode_friendly_card_on_board(card)
 
         # in opposing player's lanes
-        for location in (p1.lanes[0], p1.lanes[1]):
-            # convert all cards to features
-            location = list(map(self.encode_enemy_card_on_board, location))
-
-            # add dummy cards up to the card limit
-            location = fill_cards(location, up_to=3, features=8)
+        start += 6 * 9
+        enemy_board = encoded_state[start : start + 6 * 8].reshape(6, 8)
 
-            # add to card list
-            all_cards.extend([feature for card in location for feature in card])
-
-        # players info
-        player_features = 6 if self.version == "1.5" else 8
+        for lane in range(2):
+            for i, card in enumerate(p1.lanes[lane]):
+                enemy_board[lane * 3 + i] = self.encode_enemy_card_on_board(card)
 
-        encoded_state[:player_features] = self.encode_players(
-            p0, p1, version=self.version
-        )
         if self.use_average_deck:
-            encoded_state[player_features:-card_features] = np.array(
-                all_cards
-            ).flatten()
             encoded_state[-card_features:] = np.array(
                 list(
                     map(
@@ -258,8 +250,6 @@ class LOCMBattleEnv(LOCMEnv):
                     )
                 )
             ).mean(axis=0)
-        else:
-            encoded_state[player_features:] = np.array(all_cards).flatten()
 
         return encoded_state
 
@@ -317,11 +307,11 @@ class LOCMBattleSingleEnv(LOCMBattleEnv):
                 action = self.battle_agent.act(self.state)
 
                 try:
-                    super().step(action)
+                    self._play(action)
                 except ActionError:
                     if action == last_opponent_action:
                         # opponent is repeating the same invalid action, pass the turn instead
-                        super().step(0)
+                        self._play(0)
 
                 last_opponent_action = action
 
@@ -333,8 +323,8 @@ class LOCMBattleSingleEnv(LOCMBattleEnv):
         """Makes an action in the game."""
         player = self.state.current_player.id
 
-        # do the action
-        state, reward, done, info = super().step(action)
+        # do the action; the state is only encoded once control is back
+        reward, done, info = self._play(action)
 
         was_invalid = info["invalid"]
 
@@ -345,14 +335,16 @@ class LOCMBattleSingleEnv(LOCMBattleEnv):
             action = self.battle_agent.act(self.state)
 
             try:
-                state, reward, done, info = super().step(action)
+                reward, done, info = self._play(action)
             except ActionError:
                 if action == last_opponent_action:
                     # opponent is repeating the same invalid action, pass the turn instead
-                    state, reward, done, info = super().step(0)
+                    reward, done, info = self._play(0)
 
             last_opponent_action = action
 
+        state = self.encode_state()
+
         info["invalid"] = was_invalid
 
         if not self.play_first:
@@ -406,11 +398,11 @@ class LOCMBattleSelfPlayEnv(LOCMBattleEnv):
                 action = self.adversary_policy(state, self.action_mask)
 
                 try:
-                    state, reward, done, info = super().step(action)
+                    self._play(action)
                 except ActionError:
                     if action == last_opponent_action:
                         # opponent is repeating the same invalid action, pass the turn instead
-                        state, reward, done, info = super().step(0)
+                        self._play(0)
 
                 last_opponent_action = action
 
@@ -422,8 +414,8 @@ class LOCMBattleSelfPlayEnv(LOCMBattleEnv):
         """Makes an action in the game."""
         player = self.state.current_player.id
 
-        # do the action
-        state, reward, done, info = super().step(action)
+        # do the action; the state is only encoded once control is back
+        reward, done, info = self._play(action)
 
         was_invalid = info["invalid"]
 
@@ -435,14 +427,16 @@ class LOCMBattleSelfPlayEnv(LOCMBattleEnv):
             action = self.adversary_policy(state, self.action_mask)
 
             try:
-                state, reward, done, info = super().step(action)
+                reward, done, info = self._play(action)
             except ActionError:
                 if action == last_opponent_action:
                     # opponent is repeating the same invalid action, pass the turn instead
-                    state, reward, done, info = super().step(0)
+                    reward, done, info = self._play(0)
 
             last_opponent_action = action
 
+        state = self.encode_state()
+
         info["invalid"] = was_invalid
 
         if not self.play_first:
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
 
 from gym_locm.engine import State, PlayerOrder, Creature
+from gym_locm.engine.card import KEYWORD_BITS
+
+_GUARD = KEYWORD_BITS["G"]
+_LETHAL = KEYWORD_BITS["L"]
+_WARD = KEYWORD_BITS["W"]
 
 
 class RewardFunction(ABC):
@@ -51,19 +56,20 @@ class CoacRewardFunction(RewardFunction):
     @staticmethod
     def _eval_creature(creature) -> int:
         score = 0
+        keyword_mask = creature.keyword_mask
 
         if creature.attack > 0:
             score += 20
             score += creature.attack * 10
             score += creature.defense * 5
 
-            if creature.has_ability("W"):
+            if keyword_mask & _WARD:
                 score += creature.attack * 5
 
-            if creature.has_ability("L"):
+            if keyword_mask & _LETHAL:
                 score += 20
 
-        if creature.has_ability("G"):
+        if keyword_mask & _GUARD:
             score += 9
 
         return score